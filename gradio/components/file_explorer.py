@@ -4,20 +4,56 @@ from __future__ import annotations
 
 import fnmatch
 import os
+import re
+import threading
+import time
 from collections.abc import Callable, Sequence
+from functools import lru_cache
+from operator import attrgetter, methodcaller
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
+import anyio
 from gradio_client.documentation import document
 
 from gradio.components.base import Component, server
 from gradio.data_classes import DeveloperPath, GradioRootModel, UserProvidedPath
+from gradio.exceptions import InvalidPathError
 from gradio.i18n import I18nData
-from gradio.utils import safe_join
+from gradio.utils import LRUCache, safe_join
 
 if TYPE_CHECKING:
     from gradio.components import Timer
 
+# Directory listings whose mtime is this recent are not cached, since a change made
+# within the same filesystem timestamp tick would not be visible in the mtime.
+_LS_CACHE_MIN_AGE_NS = 2_000_000_000
+
+
+def _match_all(path: str) -> bool:  # noqa: ARG001
+    return True
+
+
+@lru_cache(maxsize=1024)
+def _compile_glob(pattern: str) -> Callable[[str], Any]:
+    """
+    Returns a function that checks whether a normalized absolute path matches a
+    glob-style pattern like fnmatch.fnmatch(), returning a truthy value on a match.
+    Patterns that match every path or only a fixed extension (e.g. "**/*.txt") are
+    special-cased, as absolute paths can be matched against them without a regex.
+    """
+    if pattern in ("*", "**/*"):
+        return _match_all
+    for prefix in ("*", "**/*"):
+        suffix = pattern[len(prefix) :]
+        if (
+            pattern.startswith(prefix)
+            and suffix.startswith(".")
+            and not any(c in suffix for c in "*?[/\\")
+        ):
+            return methodcaller("endswith", os.path.normcase(suffix))
+    return re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
 
 class FileExplorerData(GradioRootModel):
     # The outer list is the list of files selected, and the inner list
@@ -43,6 +79,7 @@ class FileExplorer(Component):
         file_count: Literal["single", "multiple"] = "multiple",
         root_dir: str | Path = ".",
         ignore_glob: str | None = None,
+        follow_symlinks: bool = True,
         label: str | I18nData | None = None,
         every: Timer | float | None = None,
         inputs: Component | Sequence[Component] | set[Component] | None = None,
@@ -68,6 +105,7 @@ class FileExplorer(Component):
             file_count: Whether to allow single or multiple files to be selected. If "single", the component will return a single absolute file path as a string. If "multiple", the component will return a list of absolute file paths as a list of strings.
             root_dir: Path to root directory to select files from. If not provided, defaults to current working directory. Raises ValueError if the directory does not exist.
             ignore_glob: The glob-style, case-sensitive pattern that will be used to exclude files from the list. For example, "*.py" will exclude all .py files from the list. See the Python glob documentation at https://docs.python.org/3/library/glob.html for more information.
+            follow_symlinks: If True, symbolic links are listed as the files or folders they point to, and links to directories can be expanded. If False, symbolic links are left out of the list. Links that resolve outside of `root_dir` cannot be expanded in either case.
             label: the label for this component. Appears above the component and is also used as the header if there are a table of examples for this component. If None and used in a `gr.Interface`, the label will be the name of the parameter this component is assigned to.
             every: Continously calls `value` to recalculate it if `value` is a function (has no effect otherwise). Can provide a Timer whose tick resets `value`, or a float that provides the regular interval for the reset Timer.
             inputs: Components that are used as inputs to calculate `value` if `value` is a function (has no effect otherwise). `value` is recalculated any time the inputs change.
@@ -90,8 +128,13 @@ class FileExplorer(Component):
         if not os.path.isdir(abs_root_dir):
             raise ValueError(f"The specified root_dir is not a directory: {root_dir}")
         self.root_dir = DeveloperPath(abs_root_dir)
+        self._root_len = len(self.root_dir) + 1
+        self._root_real = os.path.realpath(abs_root_dir)
         self.glob = glob
         self.ignore_glob = ignore_glob
+        self._glob_match = _compile_glob(glob)
+        self._ignore_match = _compile_glob(ignore_glob) if ignore_glob else None
+        self.follow_symlinks = follow_symlinks
         valid_file_count = ["single", "multiple"]
         if file_count not in valid_file_count:
             raise ValueError(
@@ -101,6 +144,10 @@ class FileExplorer(Component):
         self.height = height
         self.max_height = max_height
         self.min_height = min_height
+        # Maps an absolute directory path to (directory mtime_ns, listing), so that
+        # repeated ls() calls on an unchanged directory skip the filesystem walk.
+        self._ls_cache: LRUCache[str, tuple[int, list[dict[str, Any]]]] = LRUCache(256)
+        self._ls_cache_lock = threading.Lock()
 
         super().__init__(
             label=label,
@@ -120,6 +167,17 @@ class FileExplorer(Component):
             value=value,
         )
 
+    def __getstate__(self) -> dict[str, Any]:
+        # The listing cache and its lock are process-local and are not pickled.
+        state = self.__dict__.copy()
+        del state["_ls_cache"], state["_ls_cache_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.__dict__.update(state)
+        self._ls_cache = LRUCache(256)
+        self._ls_cache_lock = threading.Lock()
+
     def example_payload(self) -> Any:
         return [["gradio", "app.py"]]
 
@@ -151,11 +209,6 @@ class FileExplorer(Component):
             files.append(file_)
         return files
 
-    def _strip_root(self, path: str) -> str:
-        if path.startswith(self.root_dir):
-            return path[len(self.root_dir) + 1 :]
-        return path
-
     def postprocess(self, value: str | list[str] | None) -> FileExplorerData | None:
         """
         Parameters:
@@ -166,61 +219,122 @@ class FileExplorer(Component):
         if value is None:
             return None
 
-        files = [value] if isinstance(value, str) else value
-        root = []
-        for file in files:
-            root.append(self._strip_root(file).split(os.path.sep))
+        files = (value,) if isinstance(value, str) else value
+        root_dir, root_len, sep = self.root_dir, self._root_len, os.path.sep
+        root = [
+            (file[root_len:] if file.startswith(root_dir) else file).split(sep)
+            for file in files
+        ]
 
         return FileExplorerData(root=root)
 
     @server
-    def ls(self, subdirectory: list[str] | None = None) -> list[dict[str, str]] | None:
+    async def ls(
+        self, subdirectory: list[str] | None = None
+    ) -> list[dict[str, str]] | None:
         """
+        Lists the directory in a worker thread so that the filesystem calls do not block the event loop. Concurrent calls are bounded by anyio's default thread limiter.
         Returns:
             a list of dictionaries, where each dictionary represents a file or subdirectory in the given subdirectory
         """
+        return await anyio.to_thread.run_sync(self._ls, subdirectory)
+
+    def _ls(self, subdirectory: list[str] | None = None) -> list[dict[str, str]] | None:
         if subdirectory is None:
             subdirectory = []
 
         full_subdir_path = self._safe_join(subdirectory)
+        if self._is_ignored_dir(full_subdir_path):
+            return []
 
         try:
-            subdir_items = sorted(os.listdir(full_subdir_path))
+            mtime = os.stat(full_subdir_path).st_mtime_ns
         except (FileNotFoundError, PermissionError):
             return []
+        with self._ls_cache_lock:
+            cached = self._ls_cache.get(full_subdir_path)
+            if cached is not None and cached[0] == mtime:
+                self._ls_cache.move_to_end(full_subdir_path)
+                return [item.copy() for item in cached[1]]
 
-        files, folders = [], []
-        for item in subdir_items:
-            full_path = os.path.join(full_subdir_path, item)
+        # Read the whole directory in one go so that its file descriptor is
+        # released before the entries are sorted and matched.
+        try:
+            with os.scandir(full_subdir_path) as scandir_it:
+                entries = list(scandir_it)
+        except (FileNotFoundError, PermissionError):
+            return []
+        entries.sort(key=attrgetter("name"))
+
+        normcase = os.path.normcase
+        follow_symlinks = self.follow_symlinks
+        match_glob = self._glob_match
+        match_ignore = self._ignore_match
 
+        files, folders = [], []
+        for entry in entries:
             try:
-                is_file = not os.path.isdir(full_path)
-            except (PermissionError, OSError):
+                # DirEntry.is_symlink() and is_dir() are served from the d_type
+                # returned by the directory read, so only symlinks that are
+                # followed need a stat().
+                if not follow_symlinks and entry.is_symlink():
+                    continue
+                is_file = not entry.is_dir()
+            except OSError:
                 continue
 
-            valid_by_glob = fnmatch.fnmatch(full_path, self.glob)
+            normed_path = normcase(entry.path)
+            valid_by_glob = bool(match_glob(normed_path))
 
             if is_file and not valid_by_glob:
                 continue
 
-            if self.ignore_glob and fnmatch.fnmatch(full_path, self.ignore_glob):
+            if match_ignore is not None and match_ignore(normed_path):
                 continue
             target = files if is_file else folders
             target.append(
                 {
-                    "name": item,
+                    "name": entry.name,
                     "type": "file" if is_file else "folder",
                     "valid": valid_by_glob,
                 }
             )
 
-        return folders + files
+        listing = folders + files
+        if time.time_ns() - mtime > _LS_CACHE_MIN_AGE_NS:
+            with self._ls_cache_lock:
+                self._ls_cache[full_subdir_path] = (mtime, listing)
+        return [item.copy() for item in listing]
+
+    def _is_ignored_dir(self, path: str) -> bool:
+        """
+        Returns True if `path` or any of its parent directories below the root is
+        excluded by `ignore_glob`, in which case nothing below it is read.
+        """
+        if self._ignore_match is None:
+            return False
+        while len(path) > len(self.root_dir):
+            if self._ignore_match(os.path.normcase(path)):
+                return True
+            path = os.path.dirname(path)
+        return False
 
     def _safe_join(self, folders: list[str]) -> str:
-        if not folders or len(folders) == 0:
+        if not folders:
             return self.root_dir
         combined_path = UserProvidedPath(os.path.join(*folders))
         if os.name == "nt":
             combined_path = combined_path.replace("\\", "/")
         x = safe_join(self.root_dir, combined_path)
+        # safe_join() only checks the path textually, so resolve symlinks to make
+        # sure that a link inside root_dir cannot be used to list files outside it.
+        real_path = os.path.realpath(x)
+        try:
+            is_inside_root = (
+                os.path.commonpath([self._root_real, real_path]) == self._root_real
+            )
+        except ValueError:
+            is_inside_root = False
+        if not is_inside_root:
+            raise InvalidPathError()
         return x
@@ -42,6 +42,7 @@ from fastapi import (
     HTTPException,
     status,
 )
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import (
     FileResponse,
     HTMLResponse,
@@ -1619,9 +1620,22 @@ class App(FastAPI):
                 None,
             )
             if inspect.iscoroutinefunction(fn):
-                return await fn(*processed_input)
+                output = await fn(*processed_input)
             else:
-                return fn(*processed_input)
+                output = fn(*processed_input)
+            if isinstance(output, Response):
+                return output
+            # Server functions can return large payloads (e.g. directory listings), so
+            # serialize with orjson directly instead of walking the value with FastAPI's
+            # encoder, which is only used for types that orjson does not support.
+            return Response(
+                content=orjson.dumps(
+                    output,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                    default=jsonable_encoder,
+                ),
+                media_type="application/json",
+            )
 
         @router.get(
             "/queue/status",
@@ -1556,13 +1556,14 @@ class UnhashableKeyDict(MutableMapping):
         return [v for _, v in self.data]
 
 
+_os_alt_seps: list[str] = [
+    sep for sep in [os.path.sep, os.path.altsep] if sep is not None and sep != "/"
+]
+
+
 def safe_join(directory: DeveloperPath, path: UserProvidedPath) -> str:
     """Safely path to a base directory to avoid escaping the base directory.
     Borrowed from: werkzeug.security.safe_join"""
-    _os_alt_seps: list[str] = [
-        sep for sep in [os.path.sep, os.path.altsep] if sep is not None and sep != "/"
-    ]
-
     filename = posixpath.normpath(path)
     fullpath = os.path.join(directory, filename)
     if (
@@ -1,9 +1,13 @@
+import fnmatch
+import os
+import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 import gradio as gr
-from gradio.components.file_explorer import FileExplorerData
+from gradio.components.file_explorer import FileExplorerData, _compile_glob
 from gradio.exceptions import InvalidPathError
 
 
@@ -46,7 +50,8 @@ class TestFileExplorer:
         preprocessed_data = file_explorer.preprocess(input_data)
         assert preprocessed_data == []
 
-    def test_file_explorer_txt_only_glob(self, tmpdir):
+    @pytest.mark.asyncio
+    async def test_file_explorer_txt_only_glob(self, tmpdir):
         tmpdir.mkdir("foo")
         (Path(tmpdir) / "foo" / "bar").mkdir()
         (Path(tmpdir) / "foo" / "file.txt").touch()
@@ -56,7 +61,7 @@ class TestFileExplorer:
         (Path(tmpdir) / "foo" / "bar" / "bar.txt").touch()
 
         file_explorer = gr.FileExplorer(glob="*.txt", root_dir=Path(tmpdir))
-        tree = file_explorer.ls(["foo"])
+        tree = await file_explorer.ls(["foo"])
 
         answer = [
             {"name": "bar", "type": "folder", "valid": False},
@@ -65,8 +70,108 @@ class TestFileExplorer:
         ]
         assert tree == answer
 
-    def test_file_explorer_prevents_path_traversal(self, tmpdir):
+    @pytest.mark.asyncio
+    async def test_file_explorer_prevents_path_traversal(self, tmpdir):
         file_explorer = gr.FileExplorer(glob="*.txt", root_dir=Path(tmpdir))
 
         with pytest.raises(InvalidPathError):
-            file_explorer.ls(["../file.txt"])
+            await file_explorer.ls(["../file.txt"])
+
+    @pytest.mark.asyncio
+    async def test_file_explorer_ls_cache_invalidated_on_change(self, tmpdir):
+        (Path(tmpdir) / "a.txt").touch()
+        os.utime(tmpdir, ns=(0, 0))
+
+        file_explorer = gr.FileExplorer(root_dir=Path(tmpdir))
+        assert await file_explorer.ls() == [
+            {"name": "a.txt", "type": "file", "valid": True}
+        ]
+        with patch(
+            "gradio.components.file_explorer.os.scandir",
+            side_effect=AssertionError("cached listing was not used"),
+        ):
+            assert await file_explorer.ls() == [
+                {"name": "a.txt", "type": "file", "valid": True}
+            ]
+
+        (Path(tmpdir) / "b.txt").touch()
+        assert await file_explorer.ls() == [
+            {"name": "a.txt", "type": "file", "valid": True},
+            {"name": "b.txt", "type": "file", "valid": True},
+        ]
+
+    def test_file_explorer_postprocess_strips_root(self, tmpdir):
+        file_explorer = gr.FileExplorer(root_dir=Path(tmpdir))
+        value = os.path.join(str(tmpdir), "foo", "bar.txt")
+
+        assert file_explorer.postprocess(value) == FileExplorerData(
+            root=[["foo", "bar.txt"]]
+        )
+        assert file_explorer.postprocess([value, "baz.txt"]) == FileExplorerData(
+            root=[["foo", "bar.txt"], ["baz.txt"]]
+        )
+
+    @pytest.mark.skipif(
+        sys.platform.startswith("win"),
+        reason="Windows doesn't allow creation of sym links without administrative privileges",
+    )
+    @pytest.mark.asyncio
+    async def test_file_explorer_prevents_symlink_escape(self, tmp_path):
+        root = tmp_path / "root"
+        outside = tmp_path / "outside"
+        root.mkdir()
+        outside.mkdir()
+        (outside / "secret.txt").touch()
+        (root / "link").symlink_to(outside, target_is_directory=True)
+        file_explorer = gr.FileExplorer(root_dir=root)
+
+        with pytest.raises(InvalidPathError):
+            await file_explorer.ls(["link"])
+
+    @pytest.mark.asyncio
+    async def test_file_explorer_skips_ignored_directories(self, tmp_path):
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.js").touch()
+        (tmp_path / "app.js").touch()
+        file_explorer = gr.FileExplorer(root_dir=tmp_path, ignore_glob="*node_modules")
+
+        assert await file_explorer.ls() == [
+            {"name": "app.js", "type": "file", "valid": True}
+        ]
+        assert await file_explorer.ls(["node_modules"]) == []
+        assert await file_explorer.ls(["node_modules", "pkg"]) == []
+
+    @pytest.mark.skipif(
+        sys.platform.startswith("win"),
+        reason="Windows doesn't allow creation of sym links without administrative privileges",
+    )
+    @pytest.mark.asyncio
+    async def test_file_explorer_follow_symlinks(self, tmp_path):
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "file.txt").touch()
+        (tmp_path / "link").symlink_to(tmp_path / "real", target_is_directory=True)
+
+        file_explorer = gr.FileExplorer(root_dir=tmp_path)
+        assert await file_explorer.ls() == [
+            {"name": "link", "type": "folder", "valid": True},
+            {"name": "real", "type": "folder", "valid": True},
+        ]
+        assert await file_explorer.ls(["link"]) == [
+            {"name": "file.txt", "type": "file", "valid": True}
+        ]
+
+        file_explorer = gr.FileExplorer(root_dir=tmp_path, follow_symlinks=False)
+        assert await file_explorer.ls() == [
+            {"name": "real", "type": "folder", "valid": True},
+        ]
+
+
+@pytest.mark.parametrize(
+    "pattern", ["*", "**/*", "*.txt", "**/*.txt", "**/*.*", "foo*", "*.[tl]og"]
+)
+def test_compile_glob_matches_like_fnmatch(pattern):
+    paths = ["/app/foo.txt", "/app/foo.log", "/app/foo", "/app/a.b/foo", "/app/.txt"]
+    match = _compile_glob(pattern)
+    for path in paths:
+        path = os.path.normcase(path)
+        assert bool(match(path)) == fnmatch.fnmatch(path, pattern)